@@ -3,6 +3,16 @@
 # This file only contains a selection of the most common options. For a full
 # list see the documentation:
 # https://www.sphinx-doc.org/en/master/usage/configuration.html
+#
+# This file is executed by every sphinx-build invocation (including each loop of
+# an autobuild). Keep it cheap to import: no heavy imports, directory scans or
+# network access at module level.
+
+import inspect
+import os
+import re
+import sys
+from pathlib import Path
 
 # -- Path setup --------------------------------------------------------------
 
@@ -21,12 +31,10 @@ project = 'GloMPO'
 copyright = '2021, Michael Freitas Gustavo'
 author = 'Michael Freitas Gustavo'
 
-# The full version, including alpha/beta/rc tags
-with open('../glompo/_version.py', 'r') as file:
-    exec(file.read())
-
-# noinspection PyUnresolvedReferences
-release = __version__
+# The full version, including alpha/beta/rc tags.
+# Parsed from the committed source (rather than exec'd) so that the configuration never depends on the build
+# environment; any value which changes between runs invalidates Sphinx's pickled environment and forces a full rebuild.
+release = re.search(r"^__version__ = '(.+)'$", Path('../glompo/_version.py').read_text(), re.MULTILINE).group(1)
 
 # -- General configuration ---------------------------------------------------
 
@@ -36,20 +44,26 @@ release = __version__
 extensions = ['sphinx.ext.autodoc',
               'sphinx.ext.napoleon',
               'sphinx.ext.autosummary',
-              'sphinx.ext.viewcode',
-              'sphinx.ext.coverage',
+              'sphinx.ext.linkcode',
               'sphinx.ext.intersphinx',
               'sphinx_rtd_theme',
               'sphinx.ext.autosectionlabel',
               ]
 
+# The documentation coverage report is only built on request ('make coverage') rather than with every build.
+if os.environ.get('GLOMPO_DOCS_COVERAGE'):
+    extensions.append('sphinx.ext.coverage')
+
 # Add any paths that contain templates here, relative to this directory.
 templates_path = ['_templates']
 
 # List of patterns, relative to source directory, that match files and
 # directories to ignore when looking for source files.
 # This pattern also affects html_static_path and html_extra_path.
-exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store']
+exclude_patterns = ['_build', '_inv', 'Thumbs.db', '.DS_Store', '**/.ipynb_checkpoints']
+
+# Only reStructuredText sources are used, Sphinx need not look for any other file types.
+source_suffix = {'.rst': 'restructuredtext'}
 
 # -- Options for HTML output -------------------------------------------------
 
@@ -65,27 +79,21 @@ html_static_path = ['_static']
 
 # Other Sphinx settings -----------------------------------------------------
 modindex_common_prefix = ['glompo.']
-master_doc = 'index'
-needs_sphinx = '1.8.5'
+root_doc = 'index'
+needs_sphinx = '5.0'
 nitpicky = True
-nitpick_ignore = [('py:class', 'List'),
-                  ('py:class', 'Dict'),
-                  ('py:class', 'Set'),
-                  ('py:class', 'Sequence'),
-                  ('py:class', 'Tuple'),
-                  ('py:class', 'Any'),
-                  ('py:class', 'Callable'),
-                  ('py:class', 'Type'),
-                  ('py:class', 'Union'),
-                  ('py:class', 'Optional'),
-                  ('py:class', 'Inherited'),
-                  ]
+# Display every cross-referenced object by its unqualified name (e.g. 'List' rather than 'typing.List', 'BaseHunter'
+# rather than 'glompo.hunters.basehunter.BaseHunter', 'ndarray' rather than 'numpy.ndarray'). This only affects the
+# link text, the targets are unchanged. Since Sphinx 4, references into the typing module resolve without intersphinx,
+# so they no longer need to be ignored here.
+python_use_unqualified_type_names = True
+nitpick_ignore = [('py:class', 'Inherited')]
 
 # Autodoc settings ----------------------------------------------------------
+# Only packages which are actually imported by glompo are mocked. Sphinx builds a new mock for every attribute
+# accessed on these modules so each entry carries a cost during the reading phase.
 autodoc_mock_imports = ['matplotlib',
-                        'PySide2',
                         'scipy',
-                        'pytest',
                         'cma',
                         'optsam',
                         'nevergrad',
@@ -95,24 +103,71 @@ autodoc_mock_imports = ['matplotlib',
                         ]
 
 autoclass_content = 'both'
+# Type hints are rendered once, in the signature. 'both' or 'description' would resolve and format every annotation a
+# second time for the parameter descriptions.
+autodoc_typehints = 'signature'
+
+# Linkcode settings ----------------------------------------------------------
+def linkcode_resolve(domain, info):
+    """ Links each documented object to its source on GitHub at the tag matching the documented release. """
+    if domain != 'py' or not info['module']:
+        return None
+
+    obj = sys.modules.get(info['module'])
+    for part in info['fullname'].split('.'):
+        obj = getattr(obj, part, None)
+    if isinstance(obj, property):
+        obj = obj.fget
+
+    try:
+        obj = inspect.unwrap(obj)
+        path = Path(inspect.getsourcefile(obj)).resolve().relative_to(Path(__file__).resolve().parent.parent)
+        lines, start = inspect.getsourcelines(obj)
+    except (TypeError, OSError, ValueError):  # Builtins, mocked objects and attributes without source
+        return None
+
+    return f"https://github.com/mfgustavo/glompo/blob/v{release}/{path.as_posix()}#L{start}-L{start + len(lines) - 1}"
+
+
+# Autosectionlabel settings --------------------------------------------------
+# Only document titles and their direct sections are referenced, deeper headings need not be labelled.
+# Labels are prefixed by their document (e.g. :ref:`parallelism:Parallelism`) so each document keeps its own small
+# label table and identical headings in different documents do not clash.
+autosectionlabel_maxdepth = 2
+autosectionlabel_prefix_document = True
 
 # Napoleon settings ----------------------------------------------------------
 napoleon_numpy_docstring = True
 napoleon_include_init_with_doc = False
-napoleon_include_special_with_doc = True
+# Documented special methods are requested explicitly with :special-members: in the relevant directives.
+napoleon_include_special_with_doc = False
 napoleon_use_admonition_for_notes = True
 
 # Autosummary settings -------------------------------------------------------
+# The only autosummary table in the docs has no :toctree:, so no stub pages are needed. Should generation ever be
+# enabled, existing stubs are left untouched so that their mtimes do not invalidate the environment on every build.
 autosummary_generate = False
+autosummary_generate_overwrite = False
 
 # Intersphinx settings -------------------------------------------------------
-intersphinx_mapping = {
-    'python': ('https://docs.python.org/3.6', None),
-    'tables': ('https://www.pytables.org', None),
-    'dill': ('https://dill.readthedocs.io/en/latest/', None),
-    'psutil': ('https://psutil.readthedocs.io/en/latest/', None),
-    'matplotlib': ('http://matplotlib.sourceforge.net/', None),
-    'numpy': ('http://docs.scipy.org/doc/numpy/', None),
-    'scm': ('https://www.scm.com/doc/params/', None),
-    'scipy': ('http://docs.scipy.org/doc/scipy/reference/', None),
+# Every inventory below is referenced somewhere in the documentation. To avoid downloading all of them on each clean
+# build, Sphinx first looks for a local copy in _inv/ (populated by 'make inventories') and only falls back to the
+# remote inventory if it is missing. Set GLOMPO_REFRESH_INV to ignore the local copies.
+INTERSPHINX_URLS = {
+    'python': 'https://docs.python.org/3',
+    'tables': 'https://www.pytables.org',
+    'dill': 'https://dill.readthedocs.io/en/latest/',
+    'psutil': 'https://psutil.readthedocs.io/en/latest/',
+    'matplotlib': 'http://matplotlib.sourceforge.net/',
+    'numpy': 'http://docs.scipy.org/doc/numpy/',
+    'scm': 'https://www.scm.com/doc/params/',
+    'scipy': 'http://docs.scipy.org/doc/scipy/reference/',
 }
+
+if os.environ.get('GLOMPO_REFRESH_INV'):
+    intersphinx_mapping = {key: (url, None) for key, url in INTERSPHINX_URLS.items()}
+else:
+    intersphinx_mapping = {key: (url, (f'_inv/{key}.inv', None)) for key, url in INTERSPHINX_URLS.items()}
+
+# Remote inventories are cached in the build environment; only refetch them every 90 days (default is 5).
+intersphinx_cache_limit = 90
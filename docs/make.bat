@@ -7,6 +7,9 @@ REM Command file for Sphinx documentation
 if "%SPHINXBUILD%" == "" (
 	set SPHINXBUILD=sphinx-build
 )
+if "%SPHINXOPTS%" == "" (
+	set SPHINXOPTS=-j auto
+)
 set SOURCEDIR=.
 set BUILDDIR=_build
 
@@ -25,9 +28,18 @@ if errorlevel 9009 (
 	exit /b 1
 )
 
+if "%1" == "coverage" goto coverage
+
 %SPHINXBUILD% -M %1 %SOURCEDIR% %BUILDDIR% %SPHINXOPTS% %O%
 goto end
 
+REM The coverage extension is only loaded for this target.
+:coverage
+set GLOMPO_DOCS_COVERAGE=1
+%SPHINXBUILD% -M coverage %SOURCEDIR% %BUILDDIR% %SPHINXOPTS% %O%
+set GLOMPO_DOCS_COVERAGE=
+goto end
+
 :help
 %SPHINXBUILD% -M help %SOURCEDIR% %BUILDDIR% %SPHINXOPTS% %O%
 
@@ -5,7 +5,7 @@ from abc import ABC, abstractmethod
 
 __all__ = ("_CoreBase", "_CombiCore", "_OrCore", "_AndCore")
 
-from typing import Generator, Iterable
+from typing import Generator, Iterable, List
 
 
 class _CoreBase(ABC):
@@ -33,15 +33,15 @@ class _CoreBase(ABC):
 
     def __str__(self) -> str:
         """ Produces a string of the hunter/checker's name and configuration. """
-        lst = ""
-        signature = inspect.signature(self.__init__)
-        for parm in signature.parameters:
-            if parm in dir(self):
-                lst += f"{parm}={getattr(self, parm)}, "
-            else:
-                lst += f"{parm}, "
-        lst = lst[:-2]
-        return f"{self.__class__.__name__}({lst})"
+        cls = type(self)
+        parms = cls.__dict__.get('_init_parameters')
+        if parms is None:
+            parms = tuple(inspect.signature(self.__init__).parameters)
+            cls._init_parameters = parms
+
+        attrs = set(dir(self))
+        lst = ", ".join(f"{parm}={getattr(self, parm)}" if parm in attrs else parm for parm in parms)
+        return f"{cls.__name__}({lst})"
 
     def str_with_result(self) -> str:
         """ String representation of the object with its convergence result. """
@@ -59,33 +59,85 @@ class _CoreBase(ABC):
 
 
 class _CombiCore(_CoreBase):
-    """ Class to handle the AND/OR combination of two :class:`_CoreBase`\\s. """
+    """ Class to handle the AND/OR combination of :class:`_CoreBase`\\s.
+    Combinations of the same type are flattened on construction, thus :code:`a | b | c` is held as a single
+    combination of three bases rather than two nested pairs.
+    """
+
+    _keyword: str
+    _short_circuit_on: bool
 
     def __init__(self, base1: _CoreBase, base2: _CoreBase):
         super().__init__()
+        children = []
         for base in [base1, base2]:
             if not isinstance(base, _CoreBase):
                 raise TypeError("_CombiCore can only be initialised with instances of _CoreBase subclasses.")
-        self._base1 = base1
-        self._base2 = base2
-        self._index = -1
+            if type(base) is type(self):
+                children.extend(base._children)
+            else:
+                children.append(base)
+        self._children = tuple(children)
 
     def __call__(self, *args, **kwargs):
-        self.reset()
+        self._last_result = None
+        result = None
+        for i, base in enumerate(self._children):
+            base._last_result = None
+            if not isinstance(base, _CombiCore):  # Nested combinations reset their own children when called
+                base.reset()
+            result = base(*args, **kwargs)
+            if bool(result) is self._short_circuit_on:
+                for skipped in self._children[i + 1:]:
+                    skipped._last_result = None
+                    skipped.reset()
+                break
+        self._last_result = result
+        return self._last_result
 
-    def _combi_string_maker(self, keyword: str):
-        return f"[{self._base1} {keyword} \n{self._base2}]"
+    def __setstate__(self, state):
+        # Combinations pickled before flattening was introduced held exactly two bases
+        if '_children' not in state:
+            state['_children'] = (state.pop('_base1'), state.pop('_base2'))
+            state.pop('_index', None)
+        self.__dict__.update(state)
 
-    def _combi_result_string_maker(self, keyword: str):
-        return f"[{self._base1.str_with_result()} {keyword} \n" \
-               f"{self._base2.str_with_result()}]"
+    @property
+    def base1(self) -> _CoreBase:
+        """ First base in the combination. """
+        return self._children[0]
 
-    def reset(self):
-        self._base1._last_result = None
-        self._base1.reset()
+    @property
+    def base2(self) -> _CoreBase:
+        """ Last base in the combination. """
+        return self._children[-1]
+
+    def __str__(self) -> str:
+        return "".join(self._combi_string_parts([], False))
 
-        self._base2._last_result = None
-        self._base2.reset()
+    def str_with_result(self) -> str:
+        return "".join(self._combi_string_parts([], True))
+
+    def _combi_string_parts(self, parts: List[str], with_result: bool) -> List[str]:
+        """ Appends the pieces of the string representation to `parts`. Nested combinations add to the same list so
+        that the full string is only joined once rather than rebuilt at every level of the tree.
+        """
+        parts.append("[")
+        for i, base in enumerate(self._children):
+            if i:
+                parts.append(f" {self._keyword} \n")
+            if isinstance(base, _CombiCore):
+                base._combi_string_parts(parts, with_result)
+            else:
+                parts.append(base.str_with_result() if with_result else str(base))
+        parts.append("]")
+        return parts
+
+    def reset(self):
+        self._last_result = None
+        for base in self._children:
+            base._last_result = None
+            base.reset()
 
     def __iter__(self) -> Generator[_CoreBase, None, None]:
         return self._bases()
@@ -94,10 +146,9 @@ class _CombiCore(_CoreBase):
         """ Returns a generator which yields each of the bases which make up the _CombiCore. This is fully recursive
             but the returns are 'flat' (i.e. nesting is not preserved).
         """
-        for base in (self._base1, self._base2):
+        for base in self._children:
             if isinstance(base, _CombiCore):
-                for item in list(base._bases()):
-                    yield item
+                yield from base._bases()
             else:
                 yield base
 
@@ -105,28 +156,12 @@ class _CombiCore(_CoreBase):
 class _OrCore(_CombiCore):
     """ :class:`_CombiCore` which specifically handles OR combinations of :class:`._CoreBase`\\s. """
 
-    def __call__(self, *args, **kwargs):
-        super().__call__(*args, **kwargs)
-        self._last_result = self._base1(*args, **kwargs) or self._base2(*args, **kwargs)
-        return self._last_result
-
-    def __str__(self):
-        return self._combi_string_maker("|")
-
-    def str_with_result(self) -> str:
-        return self._combi_result_string_maker("|")
+    _keyword = "|"
+    _short_circuit_on = True
 
 
 class _AndCore(_CombiCore):
     """ :class:`_CombiCore` which specifically handles AND combinations of :class:`._CoreBase`\\s. """
 
-    def __call__(self, *args, **kwargs):
-        super().__call__(*args, **kwargs)
-        self._last_result = self._base1(*args, **kwargs) and self._base2(*args, **kwargs)
-        return self._last_result
-
-    def __str__(self):
-        return self._combi_string_maker("&")
-
-    def str_with_result(self) -> str:
-        return self._combi_result_string_maker("&")
+    _keyword = "&"
+    _short_circuit_on = False
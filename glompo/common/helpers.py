@@ -4,6 +4,7 @@ import logging
 import math
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterator, Optional, Sequence, Tuple, Union, overload
 
@@ -169,15 +170,18 @@ def nested_string_formatting(nested_str: str) -> str:
     level_count = 0
     lines = nested_str.split('\n')
 
-    # Indent based on number of opening and closing brackets seen.
+    # Indent based on number of opening and closing brackets seen. The indent is only rebuilt when the level changes.
+    indent = ''
     for i, line in enumerate(lines):
         if '[' in line:
-            lines[i] = f"{' ' * level_count}{line}"
+            lines[i] = indent + line
             level_count += 1
+            indent = ' ' * level_count
             continue
         if ']' in line:
             level_count -= 1
-        lines[i] = f"{' ' * level_count}{line}"
+            indent = ' ' * level_count
+        lines[i] = indent + line
 
     nested_str = "\n".join(lines)
 
@@ -214,6 +218,13 @@ def is_bounds_valid(bounds: Sequence[Tuple[float, float]], raise_invalid=True) -
     False
     """
 
+    if isinstance(bounds, np.ndarray) and bounds.ndim == 2 and bounds.shape[1] == 2:
+        invalid = (bounds[:, 0] >= bounds[:, 1]) | ~np.isfinite(bounds).all(axis=1)
+        if not invalid.any():
+            return True
+        # Only the first invalid bound is passed on so that the error matches that of the general case
+        bounds = bounds[invalid][:1]
+
     for bnd in bounds:
         if bnd[0] >= bnd[1]:
             if raise_invalid:
@@ -221,7 +232,7 @@ def is_bounds_valid(bounds: Sequence[Tuple[float, float]], raise_invalid=True) -
                                  "the opposite order. ")
             return False
 
-        if not np.all(np.isfinite(bnd)):
+        if not (math.isfinite(bnd[0]) and math.isfinite(bnd[1])):
             if raise_invalid:
                 raise ValueError("Non-finite bounds found.")
             return False
@@ -237,7 +248,7 @@ def distance(pt1: Sequence[float], pt2: Sequence[float]):
     >>> distance([0,0,0], [1,1,1])
     1.7320508075688772
     """
-    return np.sqrt(np.sum((np.array(pt1) - np.array(pt2)) ** 2))
+    return np.linalg.norm(np.subtract(pt1, pt2))
 
 
 @overload
@@ -253,6 +264,16 @@ def glompo_colors(opt_id: Optional[int] = None) -> \
     """ Returns a :class:`matplotlib.colors.ListedColormap` containing the custom GloMPO color cycle.
     If `opt_id` is provided than the specific color at that index is returned instead.
     """
+    cmap = _glompo_cmap()
+    if opt_id is not None:
+        return cmap(opt_id)
+
+    return cmap
+
+
+@lru_cache(maxsize=1)
+def _glompo_cmap() -> 'matplotlib.colors.ListedColormap':
+    """ Builds the colormap returned by :func:`glompo_colors` once and caches it for subsequent calls. """
     import matplotlib.pyplot as plt
     from matplotlib.colors import ListedColormap
 
@@ -261,11 +282,7 @@ def glompo_colors(opt_id: Optional[int] = None) -> \
         for col in plt.get_cmap(cmap).colors:
             colors.append(col)
 
-    cmap = ListedColormap(colors, "glompo_colormap")
-    if opt_id:
-        return cmap(opt_id)
-
-    return cmap
+    return ListedColormap(colors, "glompo_colormap")
 
 
 def present_memory(bytes_: float, digits: int = 2) -> str:
@@ -525,16 +542,22 @@ class WorkInDirectory:
     path
         A directory to which the working directory will be changed on entering the context manager. If the directory
         does not exist, it will be created. The working directory is changed back on exiting the context manager.
+
+    Notes
+    -----
+    The absolute path to the directory is returned on entry. Callers which can open files through this path directly
+    should prefer it over relying on the working directory.
     """
 
     def __init__(self, path: Union[Path, str]):
-        path = Path(path).resolve()
-        self.orig_dir = Path.cwd()
-        path.mkdir(parents=True, exist_ok=True)
-        os.chdir(path)
+        self.path = Path(path).resolve()
+        self.orig_dir = None
 
-    def __enter__(self):
-        pass
+    def __enter__(self) -> Path:
+        self.orig_dir = Path.cwd()
+        self.path.mkdir(parents=True, exist_ok=True)
+        os.chdir(self.path)
+        return self.path
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         os.chdir(self.orig_dir)
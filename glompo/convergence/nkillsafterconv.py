@@ -17,9 +17,12 @@ class KillsAfterConvergence(BaseChecker):
         self.n_killed = n_killed
 
     def __call__(self, manager: 'GloMPOManager') -> bool:
-        if manager.conv_counter >= self.n_converged and not self.enough_conv:
+        if not self.enough_conv:
+            if manager.conv_counter < self.n_converged:
+                self.last_result = False
+                return self.last_result
             self.enough_conv = True
             self.kill_count = len(manager.hunt_victims)
 
-        self.last_result = self.enough_conv and len(manager.hunt_victims) - self.kill_count >= self.n_killed
+        self.last_result = len(manager.hunt_victims) - self.kill_count >= self.n_killed
         return self.last_result
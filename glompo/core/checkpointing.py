@@ -1,5 +1,5 @@
+import os
 import re
-from copy import copy
 from datetime import datetime
 from pathlib import Path
 
@@ -7,6 +7,19 @@ __all__ = ("CheckpointingControl",)
 
 from typing import Union
 
+_TIME_CODES = {'date': '%Y%m%d',
+               'year': '%Y',
+               'yr': '%y',
+               'month': '%m',
+               'day': '%d',
+               'time': '%H%M%S',
+               'hour': '%H',
+               'min': '%M',
+               'sec': '%S'}
+_TIME_CODES_RE = re.compile(rf"%\(({'|'.join(_TIME_CODES)})\)")
+_REGEX_ESCAPES = str.maketrans({**{char: f'[{char}]' for char in '{(+*|.$)}'},
+                                **{char: rf'\{char}' for char in '^[]'}})
+
 
 class CheckpointingControl:
     """ Class to setup and control the checkpointing behaviour of the :class:`.GloMPOManager`.
@@ -112,43 +125,34 @@ class CheckpointingControl:
                  '%[(]time[)]': 6, '%[(]hour[)]': 2,
                  '%[(]min[)]': 2, '%[(]sec[)]': 2}
 
-        format_re = list(copy(self.naming_format))
-        for i, char in enumerate(format_re):
-            if any([char == c for c in ('{', '(', '+', '*', '|', '.', '$', ')', '}')]):
-                format_re[i] = f'[{char}]'
-            if any([char == c for c in ('^', '[', ']')]):
-                format_re[i] = rf'\{char}'
-        format_re = "".join(format_re)
+        format_re = self.naming_format.translate(_REGEX_ESCAPES)
         for key, digits in codes.items():
             format_re = format_re.replace(key, f'[0-9]{{{digits}}}')
         format_re = format_re.replace('%[(]count[)]', '(?P<index>[0-9]{3})')
 
-        self._naming_format_re = format_re
+        self._naming_format_re = re.compile(format_re)
+        self._naming_format_prefix = self.naming_format.split('%(', 1)[0]
+
+    def __setstate__(self, state):
+        # Controls pickled before the pattern was precompiled stored it as a string and had no prefix
+        if isinstance(state['_naming_format_re'], str):
+            state['_naming_format_re'] = re.compile(state['_naming_format_re'])
+        if '_naming_format_prefix' not in state:
+            state['_naming_format_prefix'] = state['naming_format'].split('%(', 1)[0]
+        self.__dict__.update(state)
 
     def get_name(self) -> str:
         """ Returns a new name for a checkpoint matching the naming format. """
 
         time = datetime.now()
-        name = copy(self.naming_format)
-        codes = {'%(date)': '%Y%m%d',
-                 '%(year)': '%Y',
-                 '%(yr)': '%y',
-                 '%(month)': '%m',
-                 '%(day)': '%d',
-                 '%(time)': '%H%M%S',
-                 '%(hour)': '%H',
-                 '%(min)': '%M',
-                 '%(sec)': '%S'}
-        for key, val in codes.items():
-            name = name.replace(key, time.strftime(val))
+        name = _TIME_CODES_RE.sub(lambda code: time.strftime(_TIME_CODES[code.group(1)]), self.naming_format)
 
         if self.checkpointing_dir.exists():
-            max_index = -1
-            matches = [re.match(self._naming_format_re, folder.name) for folder in self.checkpointing_dir.iterdir()]
-            for match in matches:
-                if match and match.lastgroup == 'index':
-                    i = int(match.group('index'))
-                    max_index = i if i > max_index else max_index
+            with os.scandir(self.checkpointing_dir) as entries:
+                matches = (self._naming_format_re.match(entry.name) for entry in entries
+                           if entry.name.startswith(self._naming_format_prefix))
+                max_index = max((int(match.group('index')) for match in matches
+                                 if match and match.lastgroup == 'index'), default=-1)
             self.count = max_index + 1
         else:
             self.count = 0
@@ -160,4 +164,4 @@ class CheckpointingControl:
 
     def matches_naming_format(self, name: str) -> bool:
         """ Returns :obj:`True` if the provided name matches the pattern in the :attr:`naming_format`. """
-        return bool(re.match(self._naming_format_re, name))
+        return bool(self._naming_format_re.match(name))
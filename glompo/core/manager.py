@@ -141,7 +141,7 @@ class GloMPOManager:
         History of system load snapshots (taken every :attr:`status_frequency` seconds). This is is a system wide value,
         not tied to the specific process.
     logger : :class:`logging.Logger`
-        GloMPO has built-in logging to allow tracking during an optimization (see :ref:`Logging Messages`). This
+        GloMPO has built-in logging to allow tracking during an optimization (see :ref:`logging:Logging Messages`). This
         attribute accesses the manager logger object.
     max_jobs : int
         Maximum number of calculation 'slots' used by all the child optimizers. This generally equates to the number of
@@ -165,7 +165,7 @@ class GloMPOManager:
         Common concurrency tool into which all results are paced by child optimizers.
     opts_daemonic : bool
         :obj:`True` if manager children are spawned as daemons. Default is :obj:`True` but can be set to :obj:`False`
-        if double process layers are needed (see :ref:`Parallelism` for more details).
+        if double process layers are needed (see :ref:`parallelism:Parallelism` for more details).
     overwrite_existing : bool
         :obj:`True` if any old files detected in the working directory maybe be deleted when the optimization run
         begins.
@@ -179,7 +179,7 @@ class GloMPOManager:
         :obj:`True` if the manager is allowed to create new children. The manager will shutdown if all children
         terminate and this is :obj:`False`.
     split_printstreams : bool
-        :obj:`True` if the printstreams for children are redirected to individual files (see :ref:`Outputs`).
+        :obj:`True` if the printstreams for children are redirected to individual files (see :ref:`outputs:Outputs`).
     status_frequency : float
         Frequency (in seconds) with which a status message is produced for the logger.
     summary_files : int
@@ -374,7 +374,7 @@ class GloMPOManager:
 
             :code:`'processes_forced'`: **Strongly discouraged**, optimizers spawned as :class:`multiprocessing.Process`
             and are themselves allowed to spawn :class:`multiprocessing.Process` for function evaluations. See
-            :ref:`Parallelism` for more details on this topic.
+            :ref:`parallelism:Parallelism` for more details on this topic.
 
         convergence_checker
             Criteria used for convergence.
@@ -423,7 +423,7 @@ class GloMPOManager:
             options (see :attr:`visualisation_args`) allow this plotting to be recorded and saved as a film.
 
         visualisation_args
-            Optional arguments to parameterize the dynamic plotting feature. See :ref:`GloMPO Scope`.
+            Optional arguments to parameterize the dynamic plotting feature. See :ref:`components/scope:GloMPO Scope`.
 
         force_terminations_after
             If a value larger than zero is provided then GloMPO is allowed to force terminate optimizers that have
@@ -690,7 +690,8 @@ class GloMPOManager:
            :attr:`~.GloMPOManager.working_dir`
               This can be changed, however, if a log file exists and you would like to append into this file, make sure
               to copy/move it to the new :attr:`working_dir` and name it :code:`'glompo_log.h5'` before loading the
-              checkpoint otherwise GloMPO will create a new log file (see :ref:`Outputs` and :ref:`Checkpointing`).
+              checkpoint otherwise GloMPO will create a new log file (see :ref:`outputs:Outputs` and
+              :ref:`components/checkpointing:Checkpointing`).
         """
 
         if self.is_initialised:
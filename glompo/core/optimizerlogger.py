@@ -12,8 +12,6 @@ from ..common.namedtuples import IterationResult
 from ..common.wrappers import needs_optional_package
 
 try:
-    import matplotlib.pyplot as plt
-    import matplotlib.lines as lines
     import dill
 except (ModuleNotFoundError, ImportError):
     pass
@@ -170,6 +168,18 @@ class BaseLogger:
             return self._storage[opt_id][track]
         return []
 
+    def get_last(self, opt_id: int, track: str) -> Any:
+        """ Returns the most recent entry in column `track` of the evaluation history of an optimizer.
+        Equivalent to :code:`get_history(opt_id, track)[-1]`, but loggers which hold histories on disk only read the
+        final row.
+
+        Raises
+        ------
+        IndexError
+            If no evaluations have been recorded for optimizer `opt_id`.
+        """
+        return self.get_history(opt_id, track)[-1]
+
     def get_metadata(self, opt_id: int, key: str) -> Any:
         """ Returns metadata of a given optimizer and key. """
         return self._storage[opt_id]['metadata'][key]
@@ -186,6 +196,8 @@ class BaseLogger:
         opt_id
             Optimizer for which the plot should be made. If :obj:`None`, plots will be made for all optimizers.
         """
+        import matplotlib.pyplot as plt
+
         is_interactive = plt.isinteractive()
         if is_interactive:
             plt.ioff()
@@ -225,6 +237,9 @@ class BaseLogger:
             If :obj:`True` the best function evaluation see thus far of each optimizer will be plotted rather than the
             function evaluation at the matching evaluation number.
         """
+        import matplotlib.lines as lines
+        import matplotlib.pyplot as plt
+
         is_interactive = plt.isinteractive()
         if is_interactive:
             plt.ioff()
@@ -344,10 +359,19 @@ class FileLogger(BaseLogger):
 
         self._o_counter = 0  # Total number of optimizers started
         self._writing_chunk = {}  # Iterations are written to disk in chunks save time
+        self._n_chunked = 0  # Number of iterations currently held across all writing chunks
         self._est_iter_size = 0  # Estimated size of a single iteration result
         self._groups = {}  # In memory address to pytables_file groups (expensive otherwise)
         self._tables = {}  # In memory address to pytables_file tables (expensive otherwise)
 
+    @classmethod
+    @needs_optional_package('dill')
+    def checkpoint_load(cls, path: Union[Path, str]):
+        opt_log = super().checkpoint_load(path)
+        if not hasattr(opt_log, '_n_chunked'):  # Logs saved before the running count was introduced
+            opt_log._n_chunked = sum(map(len, opt_log._writing_chunk.values()))
+        return opt_log
+
     def __contains__(self, opt_id: int) -> bool:
         return f'/optimizer_{opt_id}' in self.pytab_file
 
@@ -413,8 +437,9 @@ class FileLogger(BaseLogger):
 
         self._writing_chunk[iter_res.opt_id].append(
             [(self._f_counter, iter_res.x, iter_res.fx, *iter_res.extras)])
+        self._n_chunked += 1
 
-        if self._est_iter_size * sum((len(c) for c in self._writing_chunk.values())) > 100_000_000:  # Flush every 100MB
+        if self._est_iter_size * self._n_chunked > 100_000_000:  # Flush every 100MB
             self.flush(iter_res.opt_id)
 
     def put_metadata(self, opt_id: int, key: str, value: Any):
@@ -456,6 +481,17 @@ class FileLogger(BaseLogger):
 
             return []
 
+    def get_last(self, opt_id: int, track: str) -> Any:
+        try:
+            return self._storage[opt_id][track][-1]
+        except KeyError:
+            if self.has_iter_history(opt_id):
+                self.flush(opt_id)
+                table = self._get_table(opt_id)
+                if table.nrows > 0:
+                    return table.read(start=table.nrows - 1, field=track)[0]
+            raise IndexError(f"No evaluations recorded for optimizer {opt_id}.")
+
     def _get_group(self, opt_id: int) -> tb.Group:
         """ Returns the the :class:`tables.Group` object for optimizer `opt_id`. """
         if opt_id not in self._groups:
@@ -475,10 +511,11 @@ class FileLogger(BaseLogger):
         opt_ids = [opt_id] if opt_id else self._writing_chunk.keys()
 
         for o in opt_ids:
-            if len(self._writing_chunk[o]) > 0:
+            if self._writing_chunk.get(o):
                 self.put_metadata(o, 'best_iter', self._best_iters[o])
                 table = self._get_table(o)
                 table.append(self._writing_chunk[o])
+                self._n_chunked -= len(self._writing_chunk[o])
                 self._writing_chunk[o] = []
                 table.flush()
 
@@ -507,7 +544,7 @@ class FileLogger(BaseLogger):
         checksum
             Unique checksum value generated by :class:`.GloMPOManager` and stored in checkpoints and the logfile. When a
             checkpoint is loaded, GloMPO will confirm a match between the checksum value in the checkpoint and in
-            the logfile before using it (see :ref:`Checkpointing`).
+            the logfile before using it (see :ref:`components/checkpointing:Checkpointing`).
         """
         self.pytab_file = tb.open_file(str(path), mode, filters=tb.Filters(1, 'blosc'))
         self.pytab_file.root._v_attrs.checksum = checksum
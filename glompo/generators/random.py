@@ -20,5 +20,4 @@ class RandomGenerator(BaseGenerator):
             self.bounds = np.array(bounds)
 
     def generate(self, manager: 'GloMPOManager') -> np.ndarray:
-        calc = (self.bounds[:, 1] - self.bounds[:, 0]) * np.random.random(self.n_params) + self.bounds[:, 0]
-        return calc
+        return np.random.uniform(self.bounds[:, 0], self.bounds[:, 1], self.n_params)
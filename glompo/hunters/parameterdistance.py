@@ -67,11 +67,11 @@ class ParameterDistance(BaseHunter):
         for opt_id in compare_to:
             if opt_id != victim_opt_id:
                 try:
-                    h1 = np.array(log.get_history(opt_id, 'x')[-1])
+                    h1 = np.array(log.get_last(opt_id, 'x'))
                 except IndexError:
                     self.logger.debug("Unable to compare to Opt%d, no points in log", opt_id)
                     continue
-                v1 = np.array(log.get_history(victim_opt_id, 'x')[-1])
+                v1 = np.array(log.get_last(victim_opt_id, 'x'))
                 opt_dist = distance(h1, v1)
                 ratio = opt_dist / self.trans_space_dist
 
@@ -49,8 +49,7 @@ class StepSize(BaseHunter):
 
         self.last_result = False
         if len(trials) >= self.calls:
-            dists = map(distance, trials[1:], trials[:-1])
-            mean_dist = np.mean([*dists])
+            mean_dist = np.mean(np.linalg.norm(np.diff(trials, axis=0), axis=1))
             self.last_result = mean_dist <= self.tol * self.trans_space_dist
             if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(f"{hunter_opt_id} -> {victim_opt_id}\n"
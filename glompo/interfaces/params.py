@@ -496,7 +496,8 @@ class BaseParamsError:
         ----------
         x
             Sequence of parameter values to transform. May be the same length as the number of active parameters, or the
-            length of the total number of parameters in the set.
+            length of the total number of parameters in the set. A 2D array of several such vectors (one per row) is
+            also accepted and transformed in a single operation.
 
         Raises
         ------
@@ -628,7 +629,10 @@ class BaseParamsError:
 
     def _convert_parms_core(self, x) -> Tuple[np.ndarray, np.ndarray]:
         """ Core conversion code using in both directions. Returns the appropriate min and max bounds. """
-        lenx = len(x)
+        if np.ndim(x) == 0:
+            raise ValueError("Cannot parse x as a scalar. Must contain values for all parameters or values for active "
+                             "parameters.")
+        lenx = np.shape(x)[-1]
         if lenx == self.n_parms:
             min_, max_ = np.array(self.par_eng.active.range).T
         elif lenx == self.n_all_parms:
@@ -694,16 +698,16 @@ class ReaxFFError(BaseParamsError):
         and warn about attempts to activate such parameters unless `force` is used.
         """
         if toggle is True or toggle == 'on':
-            allowed = np.array(self.par_eng._get_active())
+            allowed = np.array(self.par_eng._get_active(), dtype=bool)
 
             activating = np.full(self.n_all_parms, False)
             activating[[self.par_eng[i]._id for i in parameters]] = True
 
-            invalid_act = np.argwhere((allowed == False) & (activating == True)).ravel()
+            invalid_act = np.flatnonzero(activating & ~allowed)
             if invalid_act.size > 0:
                 warnings.warn(f"The following parameters should never be activated: {invalid_act}.", UserWarning)
 
-            valid_parameters = parameters if force else np.argwhere((allowed == True) & (activating == True)).ravel()
+            valid_parameters = parameters if force else np.flatnonzero(activating & allowed)
         else:
             valid_parameters = parameters
         super().toggle_parameter(valid_parameters, toggle)
@@ -34,7 +34,7 @@ class BaseSelector(ABC):
 
     allow_spawn
         Optional function sent to the selector which is called with the manager object as argument. If it returns
-        :obj:`False` the manager will no longer spawn optimizers. See :ref:`Spawn Control`.
+        :obj:`False` the manager will no longer spawn optimizers. See :ref:`components/selectors:Spawn Control`.
 
     Examples
     --------
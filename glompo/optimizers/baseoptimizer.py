@@ -155,7 +155,7 @@ class BaseOptimizer(ABC):
     backend
         The type of concurrency used by the optimizers (processes or threads). This is not necessarily applicable to
         all optimizers. This will default to :code:`'threads'` unless forced to use :code:`'processes'` (see
-        :meth:`.GloMPOManager.setup` and :ref:`Parallelism`).
+        :meth:`.GloMPOManager.setup` and :ref:`parallelism:Parallelism`).
 
     is_log_detailed
         See :attr:`is_log_detailed`.
@@ -1,3 +1,4 @@
+import re
 from pathlib import Path
 
 from setuptools import find_packages, setup
@@ -5,8 +6,12 @@ from setuptools import find_packages, setup
 
 def get_readme():
     """Load README.rst for display on PyPI."""
-    with open("README.rst") as fhandle:
-        return fhandle.read()
+    return Path("README.rst").read_text()
+
+
+def get_version(path: str):
+    """Read __version__ from the version file without executing it."""
+    return re.search(r"^__version__ = '(.+)'$", Path(path).read_text(), re.MULTILINE).group(1)
 
 
 def get_extra_requires(path: str):
@@ -29,12 +34,9 @@ def get_extra_requires(path: str):
     return req_dict
 
 
-with open('glompo/_version.py', 'r') as file:
-    exec(file.read())
-
 setup(
     name="glompo",
-    version=__version__,
+    version=get_version('glompo/_version.py'),
     description="Globally managed parallel optimization",
     long_description=get_readme(),
     author="Michael Freitas Gustavo",
@@ -171,7 +171,10 @@ def test_string_with_result():
 
 @pytest.mark.parametrize('bnds, output', [([(0, 1)] * 5, True),
                                           ([(1, -1)] * 5, False),
-                                          ([(0, float('inf'))] * 5, False)])
+                                          ([(0, float('inf'))] * 5, False),
+                                          (np.array([(0, 1)] * 5), True),
+                                          (np.array([(0, 1), (1, -1), (0, 1)]), False),
+                                          (np.array([(0, 1), (0, np.nan), (0, 1)]), False)])
 def test_bounds(bnds, output):
     assert is_bounds_valid(bnds, raise_invalid=False) == output
     if not output:
@@ -185,16 +188,19 @@ def test_distance():
 
 def test_work_in_directory(tmp_path):
     start_direc = Path.cwd()
-    with WorkInDirectory(Path(tmp_path, 'a', 'b', 'c')):
+    context = WorkInDirectory(Path(tmp_path, 'a', 'b', 'c'))
+    assert Path.cwd() == start_direc
+    with context as path:
         assert Path.cwd() == Path(tmp_path, 'a', 'b', 'c')
+        assert path == Path(tmp_path, 'a', 'b', 'c').resolve()
     assert Path.cwd().samefile(start_direc)
 
 
-@pytest.mark.parametrize("opt_id", [10, 35, 53, 67, 73, 88, 200, None])
+@pytest.mark.parametrize("opt_id", [0, 10, 35, 53, 67, 73, 88, 200, None])
 def test_colors(opt_id):
     plt = pytest.importorskip('matplotlib.pyplot', reason="Matplotlib package needed to use these features.")
     cols = pytest.importorskip('matplotlib.colors', reason="Matplotlib package needed to use these features.")
-    if opt_id:
+    if opt_id is not None:
         if opt_id < 20:
             colors = plt.get_cmap("tab20")
             threshold = 0
@@ -1,3 +1,4 @@
+import pickle
 from pathlib import Path
 
 import pytest
@@ -45,3 +46,15 @@ def test_find_count_mixedcontent(tmp_path, cc):
 def test_matchname(cc):
     assert cc.matches_naming_format('000_s[p$e^c._{h}e|llo00000000000000_%(weird)_]000000000000000000')
     assert not cc.matches_naming_format('00_sp$e^c._{h}e|llo00000000123000_]000000000000000')
+
+
+def test_unpickle_old(cc):
+    # Controls pickled before the naming pattern was precompiled
+    old = CheckpointingControl.__new__(CheckpointingControl)
+    old.__dict__.update(vars(cc))
+    old._naming_format_re = cc._naming_format_re.pattern
+    del old._naming_format_prefix
+
+    cc = pickle.loads(pickle.dumps(old))
+    assert cc._naming_format_prefix == ''
+    assert cc.matches_naming_format('000_s[p$e^c._{h}e|llo00000000000000_%(weird)_]000000000000000000')
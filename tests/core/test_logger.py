@@ -60,6 +60,14 @@ class TestLogger:
         assert f == [i + 10 * (opt_id - 1) for i in range(1, 31)]
         assert c == [*range(1 + 30 * (opt_id - 1), 31 + 30 * (opt_id - 1))]
 
+    @pytest.mark.parametrize('opt_id', range(1, 4))
+    def test_last(self, filled_log, opt_id):
+        assert filled_log.get_last(opt_id, 'x') == [29]
+        assert filled_log.get_last(opt_id, 'fx') == 30 + 10 * (opt_id - 1)
+        assert filled_log.get_last(opt_id, 'double') == 2 * (30 + 10 * (opt_id - 1))
+        with pytest.raises(IndexError):
+            filled_log.get_last(4, 'fx')
+
     def test_message(self, filled_log):
         assert filled_log._storage[2]['messages'] == ["This is a test of the logger message system"]
 
@@ -126,6 +134,7 @@ class TestLogger:
             pytest.skip("No file created by BaseLogger")
 
         filled_log.flush()
+        assert filled_log._n_chunked == 0
         filled_log.close()
 
         with tb.open_file(tmp_path_factory.getbasetemp() / 'glompo_log.h5') as file:
@@ -133,3 +142,20 @@ class TestLogger:
             for i in range(1, 4):
                 table = file.get_node(f'/optimizer_{i}/iter_hist')
                 assert len(table.col('call_id')) == 30
+
+
+def test_load_old_chunk_count(tmp_path):
+    pytest.importorskip('dill', reason="dill package needed to test and use checkpointing")
+    log = FileLogger(n_parms=1, expected_rows=10, build_traj_plot=False)
+    log.open(tmp_path / 'glompo_log.h5', 'w', 'correctchecksum')
+    log.add_optimizer(1, 'Optimizer', datetime.datetime.now())
+    log.add_iter_history(1)
+    for i in range(3):
+        log.put_iteration(IterationResult(1, [i], i, []))
+
+    del log._n_chunked  # Logs saved before the running count was introduced
+    log.checkpoint_save(tmp_path)
+    log.pytab_file.close()
+
+    log = FileLogger.checkpoint_load(tmp_path / 'opt_log')
+    assert log._n_chunked == 3
@@ -504,7 +504,7 @@ class TestManagement:
             manager.start_manager()
 
         with Path(tmp_path, "glompo_manager_log.yml").open('r') as stream:
-            data = yaml.safe_load(stream)
+            data = yaml.load(stream, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
             print(data)
             assert reason in data['Solution']['exit cond.']
 
@@ -5,6 +5,7 @@ import shutil
 import threading
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any, Dict, Tuple, Type, Union
 
 import numpy as np
@@ -20,7 +21,8 @@ from scm.params.core.opt_components import _Step
 from scm.params.optimizers.base import BaseOptimizer, MinimizeResult
 from scm.params.parameterinterfaces.reaxff import ReaxParams
 
-from glompo.interfaces.params import _FunctionWrapper, ReaxFFError, GlompoParamsWrapper, setup_reax_from_classic
+from glompo.interfaces.params import _FunctionWrapper, BaseParamsError, ReaxFFError, GlompoParamsWrapper, \
+    setup_reax_from_classic
 from glompo.opt_selectors.baseselector import BaseSelector
 from glompo.optimizers.baseoptimizer import BaseOptimizer
 from glompo.common.namedtuples import Result
@@ -125,6 +127,19 @@ def test_wrapper_run(monkeypatch):
     assert res.success
 
 
+def test_parms_transforms_2d():
+    task = BaseParamsError.__new__(BaseParamsError)
+    task.par_eng = SimpleNamespace(range=[(0, 1), (0, 2), (1, 3)],
+                                   is_active=[True, False, True],
+                                   active=SimpleNamespace(range=[(0, 1), (1, 3)], x=[0, 1]))
+
+    for vecs in ([[0.5, 1], [1, 2]], [[0.5, 1, 1], [1, 2, 3]]):
+        scaled = task.convert_parms_real2scaled(vecs)
+        assert scaled.shape == np.shape(vecs)
+        assert np.allclose([task.convert_parms_real2scaled(vec) for vec in vecs], scaled)
+        assert np.allclose(task.convert_parms_scaled2real(scaled), vecs)
+
+
 class TestReaxFFError:
     @pytest.fixture(scope='class')
     def params_collection(self, input_files):
@@ -229,14 +244,14 @@ class TestReaxFFError:
         monkeypatch.setattr(task.dat_set, 'evaluate', mock_evaluate)
 
         params_orig = np.random.uniform(size=(100, task.n_parms))
+        params_rtrn = np.empty((len(params_orig), task.n_all_parms))
         with ThreadPoolExecutor(max_workers=np.clip(os.cpu_count(), 2, None)) as executor:
-            params_rtrn = np.array(
-                [*executor.map(lambda x: task._calculate(x)[0][1], params_orig)])
+            for i, rtrn in enumerate(executor.map(lambda x: task._calculate(x)[0][1], params_orig)):
+                params_rtrn[i] = rtrn
 
-        params_rtrn = np.array([vector[task.par_eng.is_active] for vector in params_rtrn])
+        params_rtrn = params_rtrn[:, task.par_eng.is_active]
 
-        params_orig = np.array([task.convert_parms_scaled2real(vector) for vector in params_orig])
-        params_orig = np.round(params_orig, 4)
+        params_orig = np.round(task.convert_parms_scaled2real(params_orig), 4)
         assert np.all(params_orig == params_rtrn)
 
     @pytest.mark.parametrize('simple_func', [None, DataSet()], indirect=['simple_func'])
@@ -273,6 +288,8 @@ class TestReaxFFError:
     def test_parms_transforms_raises(self, task):
         with pytest.raises(ValueError, match="Cannot parse x with length"):
             task.convert_parms_real2scaled([0.5] * 100)
+        with pytest.raises(ValueError, match="Cannot parse x as a scalar"):
+            task.convert_parms_real2scaled(0.5)
 
     @pytest.mark.parametrize('nparams, full', [(701, True),
                                                (87, False)])
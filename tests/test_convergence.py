@@ -83,9 +83,14 @@ class TestBase:
         assert (base1 & base2).__class__.__name__ == "_AndChecker"
 
     @pytest.mark.parametrize("checker, output", [(TrueChecker() | LazinessChecker(), True),
-                                                 (FalseChecker() & LazinessChecker(), False)])
+                                                 (FalseChecker() & LazinessChecker(), False),
+                                                 (FalseChecker() | TrueChecker() | LazinessChecker(), True),
+                                                 (TrueChecker() & FalseChecker() & LazinessChecker(), False),
+                                                 (FalseChecker() | TrueChecker() & FalseChecker() |
+                                                  TrueChecker() | LazinessChecker(), True)])
     def test_laziness(self, checker, output):
         assert checker(None) == output
+        assert "LazinessChecker() = None" in checker.str_with_result()
 
     @pytest.mark.parametrize("checker, output", [(PlainChecker(), "PlainChecker()"),
                                                  (any_checker(), "[PlainChecker() | \nPlainChecker()]"),
@@ -108,9 +113,9 @@ class TestBase:
                                                                  "None]"),
                                                  (FancyChecker(1, 2, 3), "FancyChecker(a=1, b=5, c) = None"),
                                                  (FalseChecker() | FalseChecker() & TrueChecker() | TrueChecker() &
-                                                  (TrueChecker() | FalseChecker()), "[[FalseChecker() = False | \n"
+                                                  (TrueChecker() | FalseChecker()), "[FalseChecker() = False | \n"
                                                                                     "[FalseChecker() = False & \n"
-                                                                                    "TrueChecker() = True]] | \n"
+                                                                                    "TrueChecker() = True] | \n"
                                                                                     "[TrueChecker() = True & \n"
                                                                                     "[TrueChecker() = True | \n"
                                                                                     "FalseChecker() = False]]]")])
@@ -123,10 +128,52 @@ class TestBase:
         checker(None)
         assert checker.str_with_result() == "[TrueChecker() = True | \nFalseChecker() = None]"
 
+    def test_reset_nested(self):
+        checker = TrueChecker() | (TrueChecker() & FalseChecker())
+        checker(None)
+        assert checker.str_with_result() == "[TrueChecker() = True | \n[TrueChecker() = None & \n" \
+                                            "FalseChecker() = None]]"
+
+    def test_reset_custom(self):
+        class ResetChecker(TrueChecker):
+            def reset(self):
+                super().reset()
+                self.n_resets += 1
+
+        base = ResetChecker()
+        base.n_resets = 0
+        checker = FalseChecker() | (TrueChecker() & base)
+        checker(None)
+        assert base.n_resets == 1
+
     def test_combi_init(self):
         with pytest.raises(TypeError):
             _CombiCore(1, 2)
 
+    def test_flatten(self):
+        a, b, c, d = PlainChecker(), PlainChecker(), PlainChecker(), PlainChecker()
+        checker = a | b | (c & d) | a
+        assert checker._children[:2] == (a, b)
+        assert isinstance(checker._children[2], _AndChecker)
+        assert checker._children[3] is a
+
+    @pytest.mark.parametrize("combi", [_OrChecker, _AndChecker])
+    def test_unpickle_old(self, combi):
+        # Combinations pickled before flattening was introduced held exactly two bases
+        base1, base2 = TrueChecker(), FalseChecker()
+        fresh = combi(base1, base2)
+
+        old = combi.__new__(combi)
+        old.__setstate__({'_last_result': None, '_base1': base1, '_base2': base2, '_index': -1})
+
+        assert old._children == fresh._children
+        assert '_index' not in vars(old)
+        assert old.base1 is base1
+        assert old.base2 is base2
+        assert str(old) == str(fresh)
+        assert old(None) == fresh(None)
+        assert old.str_with_result() == fresh.str_with_result()
+
     def test_convergence(self):
         checker = FalseChecker() | FalseChecker() & TrueChecker() | TrueChecker() & (TrueChecker() | FalseChecker())
         assert checker(None) is True
@@ -160,8 +207,7 @@ class TestOthers:
                                                  (TargetCost(100), True),
                                                  (TargetCost(-100), False),
                                                  (TargetCost(-2e-6), False)])
-    def test_conditions(self, checker, output):
-        manager = self.Manager()
+    def test_conditions(self, manager, checker, output):
         assert checker(manager) == output
 
     def test_killsafterconv(self):
@@ -183,3 +229,8 @@ class TestOthers:
         assert checker(manager)
         manager.conv_counter += 4
         assert checker(manager)
+
+
+@pytest.fixture(scope='class')
+def manager():
+    return TestOthers.Manager()